@@ -154,15 +154,13 @@ class ModelChatter:
             # Make API call (LiteLLM is synchronous, so run in thread if needed)
             import asyncio
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
+            response = await asyncio.to_thread(
                 lambda: completion(
                     model=self.model,
                     messages=messages,
                     num_retries=NUM_RETRIES,  # Use global retry setting
                     **kwargs,
-                ),
+                )
             )
             # Debug: print the raw response for troubleshooting
             print("DEBUG: Raw LiteLLM response:", response)
@@ -168,8 +168,7 @@ async def run_single_variation_evaluation(
                 f"[INFO] [Var {variation_number}, Rep {repetition_number}] SimEnvOrchestrator setup complete."
             )
             # Run the agent
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, agent.run)
+            await asyncio.to_thread(agent.run)
             print(
                 f"[INFO] [Var {variation_number}, Rep {repetition_number}] SimEnvOrchestrator run complete."
             )
@@ -217,8 +216,7 @@ async def run_single_variation_evaluation(
                 f"[INFO] [Var {variation_number}, Rep {repetition_number}] ConversationOrchestrator setup complete."
             )
             # Run the agent
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, agent.run)
+            await asyncio.to_thread(agent.run)
             print(
                 f"[INFO] [Var {variation_number}, Rep {repetition_number}] ConversationOrchestrator run complete."
             )
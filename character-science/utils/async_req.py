@@ -6,6 +6,22 @@ from tqdm import tqdm
 
 load_dotenv()
 
+_session: aiohttp.ClientSession | None = None
+
+def _get_session() -> aiohttp.ClientSession:
+    """Returns a shared ClientSession (created lazily) so TCP/TLS connections are pooled across batches and retries."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=60)
+        )
+    return _session
+
+async def close_session():
+    """Closes the shared ClientSession. Call once at the end of a script if you want a clean shutdown."""
+    if _session is not None and not _session.closed:
+        await _session.close()
+
 async def _send_async_batch_llm_requests(prompts: list[list], url: str, headers: dict, params: dict, batch_size: int, max_retries: int, verbose: bool | None = None):
     """
     Core internal function to handle batching, retries, and making requests. Don't call this function directly, use the functions below instead.
@@ -49,11 +65,11 @@ async def _send_async_batch_llm_requests(prompts: list[list], url: str, headers:
             print(f'Retry {total_retries} for {len(req_prompts)} failed requests')
             await asyncio.sleep(2 * 2 ** total_retries)  # Backoff rate
 
-        async with aiohttp.ClientSession() as session:
-            results = await asyncio.gather(
-                *(make_request(session, prompt) for prompt in req_prompts),
-                return_exceptions=True
-            )
+        session = _get_session()
+        results = await asyncio.gather(
+            *(make_request(session, prompt) for prompt in req_prompts),
+            return_exceptions=True
+        )
 
         successful_responses = [result for result in results if not isinstance(result, Exception)]
         failed_requests = [request for request, result in zip(req_prompts, results) if isinstance(result, Exception)]
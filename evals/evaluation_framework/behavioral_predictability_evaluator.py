@@ -1,7 +1,7 @@
 import sys
 import os
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -13,23 +13,16 @@ class BehavioralPredictabilityResult(BaseModel):
     reasoning: str = Field(description="Detailed reasoning for the predictability score.")
     predictability_score: int = Field(description="Score from 1-7 (1=Completely Unpredictable, 7=Entirely Predictable).")
 
-class BehavioralPredictabilityEvaluator(BaseEvaluator):
-    """
-    Evaluates the predictability of the character's behavior based on its profile.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> Dict[str, Any]:
-        character_name = character_profile.get("name", "Character")
-        
-        conversation_text = "\n".join([f"{turn['speaker']}: {turn['message']}" for turn in conversation_log])
-
-        prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's behavioral predictability.
         Predictability means behaving in a way that is expected given their defined persona.
 
         **Character Profile:**
         - Name: {character_name}
-        - Archetype: {character_profile.get('archetype', 'N/A')}
-        - System Prompt: {character_profile.get('system_prompt', 'N/A')}
+        - Archetype: {archetype}
+        - System Prompt: {system_prompt}
 
         **Conversation Transcript:**
         ---
@@ -47,6 +40,24 @@ class BehavioralPredictabilityEvaluator(BaseEvaluator):
             predictability_score: int = Field(description="Score from 1-7 (1=Completely Unpredictable, 7=Entirely Predictable).")
         ```
         """
+
+class BehavioralPredictabilityEvaluator(BaseEvaluator):
+    """
+    Evaluates the predictability of the character's behavior based on its profile.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> Dict[str, Any]:
+        character_name = character_profile.get("name", "Character")
+        
+        conversation_text = transcript
+        if conversation_text is None:
+            conversation_text = "\n".join(f"{turn['speaker']}: {turn['message']}" for turn in conversation_log)
+
+        prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            archetype=character_profile.get('archetype', 'N/A'),
+            system_prompt=character_profile.get('system_prompt', 'N/A'),
+            conversation_text=conversation_text,
+        )
         
         messages = [{"role": "user", "content": prompt}]
         
@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -13,16 +13,9 @@ class ContextRetentionResult(BaseModel):
     retention_score: int = Field(description="Score from 1-7 (1=Poor Retention, 7=Excellent Retention).")
     missed_context: List[str] = Field(default_factory=list, description="List of specific details the assistant forgot or ignored.")
 
-class ContextRetentionEvaluator(BaseEvaluator):
-    """
-    Evaluates the character's ability to retain and use context from the conversation.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> dict:
-        character_name = character_profile.get("name", "Character")
-        
-        transcript = "\n".join([f"{turn['speaker']}: {turn['message']}" for turn in conversation_log])
-
-        prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's context retention.
         Context retention means the character remembers and appropriately uses information provided by the user throughout the conversation.
 
@@ -48,6 +41,21 @@ class ContextRetentionEvaluator(BaseEvaluator):
             missed_context: List[str] = Field(default_factory=list, description="List of specific details the assistant forgot or ignored.")
         ```
         """
+
+class ContextRetentionEvaluator(BaseEvaluator):
+    """
+    Evaluates the character's ability to retain and use context from the conversation.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> dict:
+        character_name = character_profile.get("name", "Character")
+        
+        if transcript is None:
+            transcript = "\n".join(f"{turn['speaker']}: {turn['message']}" for turn in conversation_log)
+
+        prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            transcript=transcript,
+        )
         
         messages = [{"role": "user", "content": prompt}]
         
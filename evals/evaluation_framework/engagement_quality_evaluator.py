@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -12,22 +12,15 @@ class EngagementQualityResult(BaseModel):
     reasoning: str = Field(description="Detailed reasoning for the engagement score.")
     engagement_score: int = Field(description="Score from 1-7 (1=Very Unengaging, 7=Very Engaging).")
 
-class EngagementQualityEvaluator(BaseEvaluator):
-    """
-    Evaluates the quality of engagement in the conversation.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> dict:
-        character_name = character_profile.get("name", "Character")
-        
-        transcript = "\n".join([f"{turn['speaker']}: {turn['message']}" for turn in conversation_log])
-
-        prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's engagement quality.
         Engagement quality refers to how interesting, natural, and compelling the conversation is.
 
         **Character Profile:**
         - Name: {character_name}
-        - Archetype: {character_profile.get('archetype', 'N/A')}
+        - Archetype: {archetype}
 
         **Conversation Transcript:**
         ---
@@ -47,6 +40,22 @@ class EngagementQualityEvaluator(BaseEvaluator):
             engagement_score: int = Field(description="Score from 1-7 (1=Very Unengaging, 7=Very Engaging).")
         ```
         """
+
+class EngagementQualityEvaluator(BaseEvaluator):
+    """
+    Evaluates the quality of engagement in the conversation.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> dict:
+        character_name = character_profile.get("name", "Character")
+        
+        if transcript is None:
+            transcript = "\n".join(f"{turn['speaker']}: {turn['message']}" for turn in conversation_log)
+
+        prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            archetype=character_profile.get('archetype', 'N/A'),
+            transcript=transcript,
+        )
         
         messages = [{"role": "user", "content": prompt}]
         
@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -13,22 +13,15 @@ class LongTermConsistencyResult(BaseModel):
     consistency_score: int = Field(description="Score from 1-7 (1=Very Inconsistent, 7=Very Consistent).")
     contradictions: List[str] = Field(default_factory=list, description="List of any contradictions found.")
 
-class LongTermConsistencyEvaluator(BaseEvaluator):
-    """
-    Evaluates the character's consistency over a long conversation.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> dict:
-        character_name = character_profile.get("name", "Character")
-        
-        transcript = "\n".join([f"{turn['speaker']}: {turn['message']}" for turn in conversation_log])
-
-        prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's long-term consistency.
         Long-term consistency means the character does not contradict itself or forget key details established earlier in the conversation.
 
         **Character Profile:**
         - Name: {character_name}
-        - Archetype: {character_profile.get('archetype', 'N/A')}
+        - Archetype: {archetype}
 
         **Conversation Transcript:**
         ---
@@ -49,6 +42,22 @@ class LongTermConsistencyEvaluator(BaseEvaluator):
             contradictions: List[str] = Field(default_factory=list, description="List of any contradictions found.")
         ```
         """
+
+class LongTermConsistencyEvaluator(BaseEvaluator):
+    """
+    Evaluates the character's consistency over a long conversation.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> dict:
+        character_name = character_profile.get("name", "Character")
+        
+        if transcript is None:
+            transcript = "\n".join(f"{turn['speaker']}: {turn['message']}" for turn in conversation_log)
+
+        prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            archetype=character_profile.get('archetype', 'N/A'),
+            transcript=transcript,
+        )
         
         messages = [{"role": "user", "content": prompt}]
         
@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 # Add project root to Python path
@@ -13,23 +13,16 @@ class ReasoningAuthenticityResult(BaseModel):
     reasoning: str = Field(description="Detailed reasoning for the authenticity score.")
     authenticity_score: int = Field(description="Score from 1-7 (1=Very Inauthentic, 7=Very Authentic).")
 
-class ReasoningAuthenticityEvaluator(BaseEvaluator):
-    """
-    Evaluates whether the character's reasoning is authentic and believable.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> Dict[str, Any]:
-        character_name = character_profile.get("name", "Character")
-        
-        transcript = "\n".join([f"{turn['speaker']}: {turn['message']}" for turn in conversation_log])
-
-        prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's authenticity.
         Authenticity means the character's reasoning for its actions and statements feels genuine and consistent with its persona, not like a generic or evasive chatbot.
 
         **Character Profile:**
         - Name: {character_name}
-        - Archetype: {character_profile.get('archetype', 'N/A')}
-        - System Prompt: {character_profile.get('system_prompt', 'N/A')}
+        - Archetype: {archetype}
+        - System Prompt: {system_prompt}
 
         **Conversation Transcript:**
         ---
@@ -49,6 +42,23 @@ class ReasoningAuthenticityEvaluator(BaseEvaluator):
             authenticity_score: int = Field(description="Score from 1-7 (1=Very Inauthentic, 7=Very Authentic).")
         ```
         """
+
+class ReasoningAuthenticityEvaluator(BaseEvaluator):
+    """
+    Evaluates whether the character's reasoning is authentic and believable.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> Dict[str, Any]:
+        character_name = character_profile.get("name", "Character")
+        
+        if transcript is None:
+            transcript = "\n".join(f"{turn['speaker']}: {turn['message']}" for turn in conversation_log)
+
+        prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            archetype=character_profile.get('archetype', 'N/A'),
+            system_prompt=character_profile.get('system_prompt', 'N/A'),
+            transcript=transcript,
+        )
         
         messages = [{"role": "user", "content": prompt}]
         
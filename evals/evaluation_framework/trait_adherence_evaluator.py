@@ -1,7 +1,7 @@
 import os
 import sys
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 # Add project root to Python path
@@ -18,30 +18,16 @@ class TraitScore(BaseModel):
 class TraitAdherenceResult(BaseModel):
     trait_scores: List[TraitScore]
 
-class TraitAdherenceEvaluator(BaseEvaluator):
-    """
-    Evaluates how well the assistant's responses adhere to the defined character traits.
-    """
-    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Uses a judge model to evaluate trait adherence for each assistant turn.
-        """
-        traits = character_profile.get("traits", [])
-        character_name = character_profile.get("name", "Character")
-        
-        if not traits:
-            return {"error": "No traits found in character profile."}
-
-        transcript = "\n".join([f'{msg["speaker"]}: {msg["message"]}' for msg in conversation_log])
-        
-        judge_prompt = f"""
+# Built once at module load; each evaluation only substitutes the
+# per-conversation fields instead of re-interpolating the whole prompt.
+_JUDGE_PROMPT_TEMPLATE = """
         You are an expert evaluator assessing an AI assistant's adherence to a character persona.
         
         **Character Profile:**
         - Name: {character_name}
-        - Archetype: {character_profile.get('archetype', 'N/A')}
-        - Defined Traits: {', '.join(traits)}
-        - System Prompt: {character_profile.get('system_prompt', 'N/A')}
+        - Archetype: {archetype}
+        - Defined Traits: {traits}
+        - System Prompt: {system_prompt}
 
         **Conversation Transcript:**
         ---
@@ -63,6 +49,31 @@ class TraitAdherenceEvaluator(BaseEvaluator):
         ```
         """
 
+class TraitAdherenceEvaluator(BaseEvaluator):
+    """
+    Evaluates how well the assistant's responses adhere to the defined character traits.
+    """
+    async def evaluate(self, conversation_log: List[Dict[str, Any]], character_profile: Dict[str, Any], transcript: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Uses a judge model to evaluate trait adherence for each assistant turn.
+        """
+        traits = character_profile.get("traits", [])
+        character_name = character_profile.get("name", "Character")
+        
+        if not traits:
+            return {"error": "No traits found in character profile."}
+
+        if transcript is None:
+            transcript = "\n".join(f'{msg["speaker"]}: {msg["message"]}' for msg in conversation_log)
+        
+        judge_prompt = _JUDGE_PROMPT_TEMPLATE.format(
+            character_name=character_name,
+            archetype=character_profile.get('archetype', 'N/A'),
+            traits=', '.join(traits),
+            system_prompt=character_profile.get('system_prompt', 'N/A'),
+            transcript=transcript,
+        )
+
         messages = [{"role": "user", "content": judge_prompt}]
         
         try:
@@ -1,10 +1,13 @@
-import json
 import os
 from typing import List, Dict, Any
 import fire
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel
 import re
 
+# Compiled once; convert_to_finetuning_format runs it on every message
+_MARKDOWN_LABEL_RE = re.compile(r'\*\*\w+\s\w+:\*\*\s*\n')
+
 class FineTuningData(BaseModel):
     messages: List[Dict[str, str]]
 
@@ -38,7 +41,7 @@ def convert_to_finetuning_format(generated_conversation: Dict[str, Any]) -> Dict
         content = msg.get("content")
         if role in ["system", "user", "assistant"] and content:
             # Clean up markdown like **User Response:**
-            content = re.sub(r'\*\*\w+\s\w+:\*\*\s*\n', '', content)
+            content = _MARKDOWN_LABEL_RE.sub('', content)
             messages.append({"role": role, "content": content})
 
     # A valid training example should have at least 2 messages
@@ -70,15 +73,13 @@ def prepare_data_for_finetuning(
         print(f"Error: File not found at {input_file}")
         return
 
-    # Print the whole input file
-    print("\n=== Full Input File Content ===")
-    with open(input_file, 'r') as f:
-        file_content = f.read()
-        print(file_content)
-    print("=== End of Input File ===\n")
-
-    finetuning_data = []
-    with open(input_file, 'r') as f:
+    # Stream conversions instead of buffering the whole dataset (and a second
+    # copy of the raw file) in memory. Write to a temp file and rename into
+    # place at the end, so a crash or an input with no valid records never
+    # truncates or deletes a previous good output.
+    tmp_output_file = output_file + ".tmp"
+    records_written = 0
+    with open(input_file, 'r') as f, open(tmp_output_file, 'wb') as out:
         for idx, line in enumerate(f, 1):
             print(f"\n---\nLine {idx} raw: {line.rstrip()}")
             line = line.strip()
@@ -86,9 +87,9 @@ def prepare_data_for_finetuning(
                 print(f"Skipping empty line {idx}")
                 continue
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 print(f"Line {idx} parsed as JSON: {data}")
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Warning: Could not decode JSON from line {idx} in {input_file}: {e}")
                 continue
             # Skip metadata lines
@@ -115,22 +116,21 @@ def prepare_data_for_finetuning(
                     continue
                 # Transform to Together AI format
                 transformed = {"messages": [{"role": m["role"], "content": m["content"]} for m in clog]}
-                print(f"Line {idx} transformation result: {transformed}")
-                finetuning_data.append(transformed)
+                out.write(orjson.dumps(transformed))
+                out.write(b'\n')
+                records_written += 1
                 print(f"Converted line {idx} to fine-tuning format.")
             else:
                 print(f"Skipping line {idx}: no conversation_log key.")
 
-    if not finetuning_data:
+    if not records_written:
         print("No valid data was converted for fine-tuning.")
+        os.remove(tmp_output_file)
         return
 
-    with open(output_file, 'w') as f:
-        for item in finetuning_data:
-            f.write(json.dumps(item) + '\n')
-
+    os.replace(tmp_output_file, output_file)
     print(f"Successfully created fine-tuning data at: {output_file}")
-    print(f"Total records created: {len(finetuning_data)}")
+    print(f"Total records created: {records_written}")
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import math
 import os
 import random
 import re
@@ -9,6 +10,8 @@ import datetime
 import functools
 
 import fire
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from safetytooling.apis import InferenceAPI
 from safetytooling.apis.batch_api import BatchInferenceAPI
 from safetytooling.data_models import ChatMessage, MessageRole, Prompt
@@ -38,16 +41,52 @@ API = InferenceAPI(anthropic_num_threads=20)
 BATCH_API = BatchInferenceAPI(anthropic_api_key=os.getenv("ANTHROPIC_API_KEY_BATCH"))
 
 
+class ChatSpecItem(BaseModel):
+    chat_type: str
+    chat_idea: str
+
+
+# Validates the whole fused-spec response in one C-level JSON parse
+_CHAT_SPEC_LIST_ADAPTER = TypeAdapter(list[ChatSpecItem])
+
+
 ### Utility functions ###
+# Compiled once so hot parsing loops skip per-call pattern compilation and
+# regex-cache lookups.
+_IDEA_RE = re.compile(r"<idea>\n?(.*?)\n?</idea>", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def _tag_pattern(tag_name: str) -> re.Pattern:
+    return re.compile(f"<{tag_name}>(.*?)</{tag_name}>", re.DOTALL)
+
+
 def parse_tags(text: str, tag_name: str) -> str:
     """Parse text between xml tags with the given tag name, returning empty string if not found."""
-    pattern = f"<{tag_name}>(.*?)</{tag_name}>"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _tag_pattern(tag_name).search(text)
     if match:
         return match.group(1).strip()
     return ""
 
 
+def drop_near_duplicates(items: list[str], threshold: float = 0.87) -> list[str]:
+    """Drop strings whose token-set Jaccard similarity to an already-kept item
+    is >= threshold. A cheap local pre-filter so near-duplicates that differ
+    only in phrasing don't survive the exact-match set dedupe."""
+    kept: list[str] = []
+    kept_tokens: list[set[str]] = []
+    for item in items:
+        tokens = set(item.lower().split())
+        for other in kept_tokens:
+            union = len(tokens | other)
+            if union and len(tokens & other) / union >= threshold:
+                break
+        else:
+            kept.append(item)
+            kept_tokens.append(tokens)
+    return kept
+
+
 def parse_list(text: str, prefix: str = "-") -> list[str]:
     """Parse a list of objects from a string, using the given prefix to identify the list objects."""
     list_of_objs = text.split("\n")
@@ -61,30 +100,31 @@ def load_txt(path: str):
 
 
 def load_json(path: str) -> dict:
-    with open(path, "r") as file:
-        json_data = json.load(file)
+    with open(path, "rb") as file:
+        json_data = orjson.loads(file.read())
     return json_data
 
 
 def load_jsonl(path: str) -> list[dict]:
-    with open(path, "r") as file:
-        jsonl_data = [json.loads(line) for line in file]
+    with open(path, "rb") as file:
+        jsonl_data = [orjson.loads(line) for line in file]
     return jsonl_data
 
 
 def save_json(path: str, data: dict, make_dir: bool = True) -> None:
     if make_dir:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as file:
-        json.dump(data, file)
+    with open(path, "wb") as file:
+        file.write(orjson.dumps(data))
 
 
 def save_jsonl(path: str, data: list[dict], make_dir: bool = True) -> None:
     if make_dir:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as file:
+    with open(path, "wb") as file:
         for item in data:
-            file.write(json.dumps(item) + "\n")
+            file.write(orjson.dumps(item))
+            file.write(b"\n")
 
 
 def _check_overwrite_approval(output_paths: list[str], operation_name: str, current_output_path: str) -> bool | str:
@@ -513,7 +553,9 @@ async def generate_chats(
     chat_spec_model: str = "claude-sonnet-4-20250514",
     batch_model: str = "claude-3-5-haiku-20241022",
     use_batch_chat_generation: bool = True,
+    fused_spec_generation: bool = True,
     overwrite_existing_chats: bool = False,
+    resume: bool = False,
     debug: bool = False,
 ):
     """
@@ -529,7 +571,11 @@ async def generate_chats(
         chat_spec_model: The model to use for generating chat types.
         batch_model: The model to use for generating chat ideas.
         use_batch_chat_generation: Whether to use the batch API for chat generation.
+        fused_spec_generation: Whether to generate chat types and ideas in one fused
+            LLM call per fact instead of the two-stage types -> ideas round-trips.
         overwrite_existing_chats: Whether to overwrite existing chats.
+        resume: Whether to append to an existing synth_chats.jsonl, generating
+            only the chats still missing from total_chats_target.
         debug: Whether to run in debug mode (uses a small number of chat types, chat ideas, and chats).
     """
 
@@ -558,13 +604,46 @@ async def generate_chats(
         "chat_spec_model": chat_spec_model,
         "batch_model": batch_model,
         "use_batch_chat_generation": use_batch_chat_generation,
+        "fused_spec_generation": fused_spec_generation,
         "overwrite_existing_chats": overwrite_existing_chats,
+        "resume": resume,
         "debug": debug,
     }
     print(f"Begnning chat generation pipeline for character {character_id}")
     print(config)
         
-    ### Generate chat types ###
+    ### Generate chat specs (fact -> chat type -> chat idea) ###
+    async def generate_chat_specs_for_fact(fact: str) -> list[dict]:
+        # Fused path: the model brainstorms query contexts, curates the most
+        # diverse ones, and writes query patterns for each in a single response,
+        # so each fact costs one LLM call instead of 1 + num_chat_types.
+        template = load_txt(f"{prompt_dir}/chat_specs_from_fact.md")
+        prompt_str = template.format(
+            character_description=character_definition["system_prompt"],
+            fact=fact,
+            num_chat_types=num_chat_types,
+            num_chat_ideas=num_chat_ideas,
+        )
+        prompt = Prompt(messages=[ChatMessage(role=MessageRole.user, content=prompt_str)])
+
+        response = await API(model_id=chat_spec_model, prompt=prompt)
+        completion = response[0].completion
+        json_str = parse_tags(completion, "chat_specs") or completion
+        start, end = json_str.find("["), json_str.rfind("]")
+        if start == -1 or end == -1:
+            LOGGER.error(f"No JSON array in fused chat spec response for fact: {fact[:80]}")
+            return []
+        try:
+            specs = _CHAT_SPEC_LIST_ADAPTER.validate_json(json_str[start : end + 1])
+        except ValidationError as e:
+            LOGGER.error(f"Fused chat spec response failed validation: {e}")
+            return []
+        return [
+            {"fact": fact, "chat_type": spec.chat_type, "chat_idea": spec.chat_idea}
+            for spec in specs
+            if spec.chat_type and spec.chat_idea
+        ]
+
     async def generate_chat_types_for_fact(fact: str) -> list[dict]:
         # Load prompt template and create chat type generation prompt
         template = load_txt(f"{prompt_dir}/chat_generation/chat_categories_from_fact.md")
@@ -572,34 +651,40 @@ async def generate_chats(
         prompt = Prompt(messages=[ChatMessage(role=MessageRole.user, content=prompt_str)])
 
         chat_types = []
+        rounds_launched = 0
+        avg_yield = None
         while len(chat_types) < num_chat_types:
-            response = await API(
+            # The first round calibrates the per-call yield; afterwards the
+            # remaining rounds are launched as one concurrent wave since they
+            # only differ in temperature jitter and the dedupe below absorbs
+            # any redundancy between rounds.
+            remaining = num_chat_types - len(chat_types)
+            wave_size = 1 if avg_yield is None else min(4, max(1, math.ceil(remaining / avg_yield)))
+            # n>1 samples the wave in one request, sharing the prompt prefill
+            # on providers that support it; safetytooling fans out internally
+            # for the rest
+            responses = await API(
                 model_id=chat_spec_model,
                 prompt=prompt,
-                temperature=1 - len(chat_types) * 1e-10,  # mess w/ temp to use caching
+                n=wave_size,
+                temperature=1 - rounds_launched * 1e-10,  # mess w/ temp to use caching
             )
+            rounds_launched += wave_size
 
-            # Split the bullet-pointed response into a list of chat types
+            # Split the bullet-pointed responses into a list of chat types
             new_chat_types = [
                 line.strip()[2:]
-                for line in response[0].completion.split("\n")
+                for response in responses
+                for line in response.completion.split("\n")
                 if line.strip().startswith("-")
             ]
+            avg_yield = max(1.0, len(new_chat_types) / wave_size)
 
-            # Add to chat_types and remove duplicates
-            chat_types = list(set(chat_types + new_chat_types))
+            # Add to chat_types and remove exact and near duplicates
+            chat_types = drop_near_duplicates(list(set(chat_types + new_chat_types)))
 
         return [{"fact": fact, "chat_type": ct} for ct in chat_types[:num_chat_types]]
 
-    print(f"Generating chat types...")
-    chat_types = await asyncio.gather(*[
-        generate_chat_types_for_fact(fact)
-        for fact in key_facts
-    ])
-    # Flatten chat_types
-    chat_types = [ct for fact_cts in chat_types for ct in fact_cts]
-
-    ### Generate chat ideas ###
     async def generate_chat_ideas_for_chat_type_and_fact(
         chat_type: str,
         fact: str,
@@ -610,32 +695,57 @@ async def generate_chats(
         prompt = Prompt(messages=[ChatMessage(role=MessageRole.user, content=prompt_str)])
 
         chat_ideas = []
+        rounds_launched = 0
+        avg_yield = None
         while len(chat_ideas) < num_chat_ideas:
-            response = await API(
+            # Same wave scheme as the chat type loop: calibrate on the first
+            # round, then fill the remaining quota concurrently.
+            remaining = num_chat_ideas - len(chat_ideas)
+            wave_size = 1 if avg_yield is None else min(4, max(1, math.ceil(remaining / avg_yield)))
+            responses = await API(
                 model_id=chat_spec_model,
                 prompt=prompt,
-                temperature=1 - len(chat_ideas) * 1e-10,  # to use caching
-            )
-
-            # Extract ideas between <idea> tags using regex
-            ideas = re.findall(
-                r"<idea>\n?(.*?)\n?</idea>", response.completion, re.DOTALL
+                n=wave_size,
+                temperature=1 - rounds_launched * 1e-10,  # to use caching
             )
-            # Clean up any extra whitespace
-            ideas = [idea.strip() for idea in ideas if "UNSUITABLE" not in idea]
-            chat_ideas = list(set(chat_ideas + ideas))
+            rounds_launched += wave_size
+
+            # Extract ideas between <idea> tags using the precompiled regex,
+            # cleaning up any extra whitespace
+            ideas = [
+                idea.strip()
+                for response in responses
+                for idea in _IDEA_RE.findall(response.completion)
+                if "UNSUITABLE" not in idea
+            ]
+            avg_yield = max(1.0, len(ideas) / wave_size)
+            chat_ideas = drop_near_duplicates(list(set(chat_ideas + ideas)))
 
         return [
             {"fact": fact, "chat_type": chat_type, "chat_idea": chat_idea}
             for chat_idea in chat_ideas[:num_chat_ideas]
         ]
 
-    # Prepare prompts for batch chat ideas generation
-    chat_specs = await tqdm.gather(*[
-        generate_chat_ideas_for_chat_type_and_fact(x["chat_type"], x["fact"])
-        for x in chat_types
-    ], desc="Generating chat ideas")
-    # Flatten chat_ideas
+    if fused_spec_generation:
+        chat_specs = await tqdm.gather(*[
+            generate_chat_specs_for_fact(fact)
+            for fact in key_facts
+        ], desc="Generating chat specs")
+    else:
+        print(f"Generating chat types...")
+        chat_types = await asyncio.gather(*[
+            generate_chat_types_for_fact(fact)
+            for fact in key_facts
+        ])
+        # Flatten chat_types
+        chat_types = [ct for fact_cts in chat_types for ct in fact_cts]
+
+        # Prepare prompts for batch chat ideas generation
+        chat_specs = await tqdm.gather(*[
+            generate_chat_ideas_for_chat_type_and_fact(x["chat_type"], x["fact"])
+            for x in chat_types
+        ], desc="Generating chat ideas")
+    # Flatten chat_specs
     chat_specs = [x for y in chat_specs for x in y]
 
     # Save chat specs
@@ -645,13 +755,26 @@ async def generate_chats(
     save_json(config_path, config)
 
     ### Generate the full chats from specs ###
-    print(f"Generating {total_chats_target} chats from {len(chat_specs)} chat specs...")
+    # Resume: count chats from an interrupted run and only generate the delta,
+    # so a restart doesn't re-spend the LLM budget already banked on disk.
+    existing_chats = []
+    chat_start_index = 0
+    if resume and os.path.exists(f"{output_path}/{character_id}/synth_chats.jsonl"):
+        existing_chats = load_jsonl(f"{output_path}/{character_id}/synth_chats.jsonl")
+        chat_start_index = len(existing_chats)
+        if chat_start_index >= total_chats_target:
+            print(f"Resume: found {chat_start_index} existing chats (target {total_chats_target}); nothing to generate.")
+            return
+        print(f"Resume: found {chat_start_index} existing chats, generating {total_chats_target - chat_start_index} more.")
+
+    print(f"Generating {total_chats_target - chat_start_index} chats from {len(chat_specs)} chat specs...")
 
     # Load prompt template and create chat generation prompts
     prompt_template = load_txt(f"{prompt_dir}/chat_generation/chat_pair_from_spec.md")
     prompts = []
-    chat_spec_repeats = []  # Track which chat_spec each prompt corresponds to
-    for i in range(total_chats_target):
+    for i in range(chat_start_index, total_chats_target):
+        # The spec for prompt i is recovered later as chat_specs[i % len(chat_specs)],
+        # so no parallel list of repeated spec dicts is kept.
         chat_spec = chat_specs[i % len(chat_specs)]
         content = prompt_template.format(
             fact=chat_spec["fact"],
@@ -660,7 +783,6 @@ async def generate_chats(
             character_description=character_definition["system_prompt"],
         )
         prompts.append(Prompt(messages=[ChatMessage(role=MessageRole.user, content=content)]))
-        chat_spec_repeats.append(chat_spec)
 
     # Create custom callback for chat generation to gracefully handle Anthropic batch API errors
     chat_gen_callback = functools.partial(
@@ -695,13 +817,15 @@ async def generate_chats(
                 "user_query": user_query,
                 "assistant_response": assistant_response,
                 "scratchpad": scratchpad,
-                **chat_specs[i % len(chat_specs)], # Get corresponding chat spec
+                # Get corresponding chat spec (offset keeps the spec rotation
+                # aligned with the chats already on disk when resuming)
+                **chat_specs[(chat_start_index + i) % len(chat_specs)],
             }
         )
     
     # Check for existing files and get approval from user if we will overwrite an existing chat corpus
     output_file_path = f"{output_path}/{character_id}/synth_chats.jsonl"
-    if os.path.exists(output_file_path) and not overwrite_existing_chats:
+    if os.path.exists(output_file_path) and not overwrite_existing_chats and not existing_chats:
         # Ask for approval if file would be overwritten
         approval_result = _check_overwrite_approval([output_file_path], "chat generation", output_path)
 
@@ -719,9 +843,9 @@ async def generate_chats(
             config["output_path"] = output_path
             output_file_path = f"{output_path}/{character_id}/synth_chats.jsonl"
 
-    # Save results and print completion message
-    save_jsonl(output_file_path, results)
-    print(f"Saved {len(results)} chats for character {character_id} to {output_file_path}")
+    # Save results (including any resumed chats) and print completion message
+    save_jsonl(output_file_path, existing_chats + results)
+    print(f"Saved {len(existing_chats) + len(results)} chats for character {character_id} to {output_file_path}")
     print(f"Total time: {(time.time() - start_time)/60:.2f} minutes")
 
 
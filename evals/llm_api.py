@@ -1,14 +1,15 @@
 import logging
 import json
+import random
 import re
 import asyncio
+import time
 import os
+import orjson
 import sys
 import requests
 from typing import Optional, Type, TypeVar, List, Dict, Any
 
-import litellm
-from litellm.caching.caching import Cache
 from pydantic import BaseModel, Field, ValidationError
 
 # NOTE: load_vllm_lora_adapter is sourced from:
@@ -30,16 +31,93 @@ class LLMCallResult(BaseModel):
     api_log: APICallLog
     error: Optional[str] = None
 
-# load dotenv variables if available
-from dotenv import load_dotenv
-load_dotenv()
-
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# --- Enable litellm local cache (in-memory by default) ---
-# litellm.cache = Cache(type="disk")  # You can specify type=... for redis, s3, etc.
+# litellm (and its long tail of provider SDKs) is imported lazily on the
+# first completion call, so consumers that only need clean_json_string or the
+# Pydantic models skip its import cost entirely.
+_litellm = None
+
+
+def _get_litellm():
+    """Import and configure litellm on first use, caching the module."""
+    global _litellm
+    if _litellm is None:
+        # load dotenv variables if available
+        from dotenv import load_dotenv
+        load_dotenv()
+
+        import litellm
+        from litellm.caching.caching import Cache
+
+        # --- Enable litellm on-disk cache ---
+        # Keys on the full completion request (model, messages, temperature,
+        # ...), so identical prompts are served from disk across runs.
+        # Individual calls can opt out by passing caching=False to
+        # call_llm_api.
+        litellm.cache = Cache(type="disk", disk_cache_dir=os.path.join(os.path.dirname(__file__), ".llm_cache"))
+        _litellm = litellm
+    return _litellm
+
+# Shared keep-alive session for the plain-HTTP vLLM admin calls, so repeated
+# adapter loads reuse one TCP/TLS connection instead of handshaking each time.
+_http_session = requests.Session()
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter over requests/min and estimated tokens/min.
+
+    Proactively paces call_llm_api so concurrent callers stay under the
+    provider quota instead of discovering it through 429 retries.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = requests_per_minute
+        self._token_capacity = tokens_per_minute
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_capacity = min(
+            self.requests_per_minute,
+            self._request_capacity + elapsed * self.requests_per_minute / 60.0,
+        )
+        self._token_capacity = min(
+            self.tokens_per_minute,
+            self._token_capacity + elapsed * self.tokens_per_minute / 60.0,
+        )
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Block until one request plus estimated_tokens of budget is available."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._request_capacity >= 1 and self._token_capacity >= estimated_tokens:
+                    self._request_capacity -= 1
+                    self._token_capacity -= estimated_tokens
+                    return
+                request_wait = (1 - self._request_capacity) * 60.0 / self.requests_per_minute
+                token_wait = (
+                    (estimated_tokens - self._token_capacity) * 60.0 / self.tokens_per_minute
+                )
+                await asyncio.sleep(max(request_wait, token_wait, 0.01))
+
+
+# Configured from the environment so pipelines can match their provider tier
+# without code changes; unset means no client-side pacing (litellm retries
+# still handle any 429s).
+_rate_limiter: Optional[AsyncRateLimiter] = None
+if os.environ.get("LLM_REQUESTS_PER_MINUTE"):
+    _rate_limiter = AsyncRateLimiter(
+        requests_per_minute=float(os.environ["LLM_REQUESTS_PER_MINUTE"]),
+        tokens_per_minute=float(os.environ.get("LLM_TOKENS_PER_MINUTE", "1e9")),
+    )
 
 # --- Pydantic Models for Structured Responses ---
 
@@ -67,29 +145,48 @@ class CharacterAnalysis(BaseModel):
 
 T = TypeVar("T", bound=BaseModel)
 
+# Matches markdown fences (```json ... ``` or ``` ... ```); compiled once
+# since this runs on every parsed LLM response.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
 def clean_json_string(json_string: str) -> str:
     """
     Cleans a JSON string by removing markdown code fences and correcting common formatting issues.
     """
-    # Remove markdown fences (```json ... ``` or ``` ... ```)
-    match = re.search(r"```(json)?\s*(.*?)\s*```", json_string, re.DOTALL)
+    match = _FENCE_RE.search(json_string)
     if match:
-        return match.group(2).strip()
+        return match.group(1).strip()
     return json_string.strip()
 
 # --- Helper Functions for Backend Determination ---
 
+# Known litellm provider prefixes; a model with "/" but none of these is a
+# raw HuggingFace repo id. str.startswith takes the tuple directly, so the
+# per-call generator + list build is gone.
+_PROVIDER_PREFIXES = (
+    "openrouter/", "anthropic/", "openai/", "google/", "together/",
+    "huggingface/", "cohere/", "deepseek/", "groq/", "perplexity/",
+    "mistral/", "vertex_ai/", "bedrock/", "replicate/",
+)
+
+
 def _is_huggingface_model(model: str) -> bool:
     """Check if this is a HuggingFace model (contains "/" but no provider prefix)."""
-    return "/" in model and not any(model.startswith(prefix) for prefix in [
-        "openrouter/", "anthropic/", "openai/", "google/", "together/", 
-        "huggingface/", "cohere/", "deepseek/", "groq/", "perplexity/",
-        "mistral/", "vertex_ai/", "bedrock/", "replicate/"
-    ])
-
-def _determine_backend_config(model: str, use_runpod: bool, vllm_port: int, runpod_endpoint_id: str) -> tuple[str, str, str, str]:
-    """Determine backend configuration and return (log_message, fallback_model, vllm_api_base, final_model)."""
+    return "/" in model and not model.startswith(_PROVIDER_PREFIXES)
+
+def _determine_backend_config(model: str, use_runpod: bool, vllm_port: int, runpod_endpoint_id: str) -> tuple[str, str, str, str, bool]:
+    """Determine backend configuration and return (log_message, fallback_model, vllm_api_base, final_model, hedge_fallback).
+
+    hedge_fallback is True only when the fallback is the same model served
+    through another provider, so a hedged response is interchangeable with the
+    primary's. Different-model fallbacks (e.g. qwen for a fine-tuned HF
+    checkpoint) are only tried after the primary has actually failed —
+    otherwise a merely slow primary would silently return another model's
+    output attributed to the requested one.
+    """
     is_hf_model = _is_huggingface_model(model)
+    hedge_fallback = False
     
     if is_hf_model and use_runpod:
         # HF model with RunPod - no fallback
@@ -106,6 +203,7 @@ def _determine_backend_config(model: str, use_runpod: bool, vllm_port: int, runp
     elif model == "claude-sonnet-4-20250514":
         log_message = f"Backend chosen: Anthropic for Claude model"
         fallback_model = "openrouter/anthropic/claude-sonnet-4"
+        hedge_fallback = True
         vllm_api_base = None
         final_model = "anthropic/claude-sonnet-4-20250514"
     elif "claude" in model:
@@ -119,7 +217,7 @@ def _determine_backend_config(model: str, use_runpod: bool, vllm_port: int, runp
         vllm_api_base = None
         final_model = model
     
-    return log_message, fallback_model, vllm_api_base, final_model
+    return log_message, fallback_model, vllm_api_base, final_model, hedge_fallback
 
 def _build_completion_params(model: str, messages: List[Dict[str, str]], temperature: float, 
                            max_tokens: int, max_retries: int, caching: bool, 
@@ -146,6 +244,27 @@ def _build_completion_params(model: str, messages: List[Dict[str, str]], tempera
 
 # --- Centralized API Call Function ---
 
+# How long to wait before hedging with the fallback model on same-model
+# routes. The fallback task starts while the primary is still in flight;
+# whichever returns first wins. Overridable so deployments with long
+# generations can push it above their typical latency.
+FALLBACK_HEDGE_DELAY = float(os.environ.get("LLM_FALLBACK_HEDGE_DELAY", "5.0"))
+
+
+def _extract_response_fields(raw_response_dict: dict) -> tuple[str, Optional[str]]:
+    """Pull the text content and any reasoning content out of a raw completion dict."""
+    if 'choices' in raw_response_dict and raw_response_dict['choices']:
+        choice = raw_response_dict['choices'][0]
+        if 'message' in choice:
+            return choice['message'].get('content', ''), choice['message'].get('reasoning_content', None)
+    return str(raw_response_dict), None
+
+# In-process single-flight map: concurrent callers issuing an identical
+# request share one outstanding completion instead of racing duplicates to
+# the provider before the disk cache has been written.
+_inflight: Dict[str, asyncio.Future] = {}
+
+
 async def call_llm_api(
     messages: List[Dict[str, str]],
     model: str,
@@ -159,6 +278,10 @@ async def call_llm_api(
     """
     Makes an asynchronous call to an LLM API using litellm, with comprehensive logging.
 
+    Identical concurrent requests are coalesced into a single provider call
+    (single-flight) whenever caching is enabled, since the cache already makes
+    identical requests return identical responses.
+
     Args:
         messages: A list of messages in the conversation.
         model: The model to use for the completion (e.g., "claude-sonnet-4-20250514").
@@ -173,6 +296,56 @@ async def call_llm_api(
         LLMCallResult containing the response, structured response (if applicable), and API log.
     """
     
+    # Same escape hatch the safety-tooling cache honors: NO_CACHE=1 disables
+    # litellm disk-cache reads/writes for every call in the process.
+    if os.environ.get("NO_CACHE", "").lower().strip() in ("1", "true", "yes"):
+        caching = False
+
+    if not caching:
+        # Uncached callers explicitly want an independent sample
+        return await _call_llm_api_uncoalesced(
+            messages, model, response_model, temperature, max_tokens,
+            max_retries, thinking, caching,
+        )
+
+    flight_key = json.dumps(
+        [model, messages, temperature, max_tokens, thinking, max_retries,
+         response_model.__name__ if response_model else None],
+        sort_keys=True,
+    )
+    existing = _inflight.get(flight_key)
+    if existing is not None:
+        return await existing
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[flight_key] = future
+    try:
+        result = await _call_llm_api_uncoalesced(
+            messages, model, response_model, temperature, max_tokens,
+            max_retries, thinking, caching,
+        )
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved in case no other caller joined
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(flight_key, None)
+
+
+async def _call_llm_api_uncoalesced(
+    messages: List[Dict[str, str]],
+    model: str,
+    response_model: Optional[Type[T]],
+    temperature: float,
+    max_tokens: int,
+    max_retries: int,
+    thinking: bool,
+    caching: bool,
+) -> LLMCallResult:
+    """The actual completion flow behind call_llm_api's single-flight wrapper."""
     original_model = model
     reasoning_content = None
     raw_response_dict = None
@@ -184,75 +357,109 @@ async def call_llm_api(
     vllm_port = 7337
     runpod_endpoint_id = "pmave9bk168p0q"
     
-    log_message, fallback_model, vllm_api_base, model = _determine_backend_config(
+    log_message, fallback_model, vllm_api_base, model, hedge_fallback = _determine_backend_config(
         model, use_runpod, vllm_port, runpod_endpoint_id
     )
     logger.info(log_message)
 
-    try:
-        logger.info(f"Attempting to call model: {model}")
-        completion_params = _build_completion_params(
-            model, messages, temperature, max_tokens, max_retries, caching, vllm_api_base, thinking
-        )
-            
-        # For Claude models, skip reasoning_effort for now to avoid temperature conflicts
-        # if "claude" in model:
-        #     completion_params["reasoning_effort"] = "medium"
-        raw_response = await litellm.acompletion(**completion_params)
-        raw_response_dict = raw_response.dict()
-        # Extract content and reasoning_content
-        if 'choices' in raw_response_dict and raw_response_dict['choices']:
-            choice = raw_response_dict['choices'][0]
-            if 'message' in choice:
-                response_text = choice['message'].get('content', '')
-                reasoning_content = choice['message'].get('reasoning_content', None)
-            else:
-                response_text = str(raw_response_dict)
-        else:
-            response_text = str(raw_response_dict)
-        logger.info(f"Successfully received response from {model}")
-    except Exception as e:
-        logger.warning(f"Initial API call for model {model} failed: {e}. Attempting fallback.")
-        error_msg = f"API call for model {original_model} failed. Error: {e}"
-        # Try fallback if we have one
-        if fallback_model:
+    completion_params = _build_completion_params(
+        model, messages, temperature, max_tokens, max_retries, caching, vllm_api_base, thinking
+    )
+
+    # When a structured response is requested, have the provider enforce the
+    # schema server-side; litellm translates the pydantic model into the
+    # provider's json_schema/tool-use format where supported, so responses
+    # arrive as valid JSON instead of relying on the prompt and the
+    # clean_json_string fallback below.
+    if response_model is not None:
+        completion_params["response_format"] = response_model
+
+    # For Claude models, skip reasoning_effort for now to avoid temperature conflicts
+    # if "claude" in model:
+    #     completion_params["reasoning_effort"] = "medium"
+
+    async def _delayed_completion(delay: float, params: dict):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if _rate_limiter is not None:
+            # Rough but cheap estimate: ~4 chars per prompt token plus the
+            # reserved output budget
+            prompt_chars = sum(len(m.get("content", "")) for m in params["messages"])
+            await _rate_limiter.acquire(prompt_chars // 4 + params["max_tokens"])
+        logger.info(f"Attempting to call model: {params['model']}")
+        return await _get_litellm().acompletion(**params)
+
+    fallback_params = None
+    if fallback_model:
+        fallback_params = {
+            "model": fallback_model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": 60.0,
+            "max_retries": max_retries,
+            "caching": caching
+        }
+        if response_model is not None:
+            fallback_params["response_format"] = response_model
+
+    failures = []
+    if fallback_params is not None and hedge_fallback:
+        # Same model behind another provider: hedge instead of waiting for
+        # the primary to fail, since either response is interchangeable and a
+        # single slow primary otherwise serializes the fallback behind its
+        # full timeout.
+        attempt_tasks = {asyncio.create_task(_delayed_completion(0, completion_params)): model}
+        attempt_tasks[asyncio.create_task(_delayed_completion(FALLBACK_HEDGE_DELAY, fallback_params))] = fallback_model
+
+        pending = set(attempt_tasks)
+        try:
+            while pending and raw_response_dict is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    attempt_model = attempt_tasks[task]
+                    try:
+                        raw_response = task.result()
+                    except Exception as e:
+                        logger.warning(f"API call for model {attempt_model} failed: {e}")
+                        failures.append(f"{attempt_model}: {e}")
+                        continue
+                    model = attempt_model  # Update model for logging
+                    raw_response_dict = raw_response.dict()
+                    response_text, reasoning_content = _extract_response_fields(raw_response_dict)
+                    logger.info(f"Successfully received response from {model}")
+                    break
+        finally:
+            # First non-error response wins; cancel the losing attempt
+            for task in pending:
+                task.cancel()
+    else:
+        # Different-model fallback (or none): try the primary to completion
+        # first so a slow-but-healthy primary is never displaced by another
+        # model's output.
+        attempt_order = [(model, completion_params)]
+        if fallback_params is not None:
+            attempt_order.append((fallback_model, fallback_params))
+        for attempt_model, attempt_params in attempt_order:
             try:
-                logger.info(f"Attempting to call fallback model: {fallback_model}")
-                completion_params = {
-                    "model": fallback_model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "timeout": 60.0,
-                    "max_retries": max_retries,
-                    "caching": caching
-                }
-                if "claude" in fallback_model and "reasoning_effort" in completion_params:
-                    # Remove reasoning_effort for fallback model
-                    pass
-                elif "reasoning_effort" in completion_params:
-                    del completion_params["reasoning_effort"]
-                raw_response = await litellm.acompletion(**completion_params)
-                raw_response_dict = raw_response.dict()
-                if 'choices' in raw_response_dict and raw_response_dict['choices']:
-                    choice = raw_response_dict['choices'][0]
-                    if 'message' in choice:
-                        response_text = choice['message'].get('content', '')
-                        reasoning_content = choice['message'].get('reasoning_content', None)
-                    else:
-                        response_text = str(raw_response_dict)
-                else:
-                    response_text = str(raw_response_dict)
-                model = fallback_model  # Update model for logging
-                error_msg = None  # Clear error since fallback succeeded
-                logger.info(f"Successfully received response from {fallback_model}")
-            except Exception as fallback_e:
-                error_msg = f"API call for model {original_model} and fallback {fallback_model} failed. Error: {fallback_e}"
-                logger.error(error_msg)
-                response_text = f"[ERROR: {error_msg}]"
+                raw_response = await _delayed_completion(0, attempt_params)
+            except Exception as e:
+                logger.warning(f"API call for model {attempt_model} failed: {e}")
+                failures.append(f"{attempt_model}: {e}")
+                continue
+            model = attempt_model  # Update model for logging
+            raw_response_dict = raw_response.dict()
+            response_text, reasoning_content = _extract_response_fields(raw_response_dict)
+            logger.info(f"Successfully received response from {model}")
+            break
+
+    if raw_response_dict is None:
+        if fallback_model:
+            error_msg = f"API call for model {original_model} and fallback {fallback_model} failed. Error: {'; '.join(failures)}"
         else:
-            logger.error(error_msg)
-            response_text = f"[ERROR: {error_msg}]"
+            error_msg = f"API call for model {original_model} failed. Error: {'; '.join(failures)}"
+        logger.error(error_msg)
+        response_text = f"[ERROR: {error_msg}]"
 
     # Create API log
     api_log = APICallLog(
@@ -267,7 +474,7 @@ async def call_llm_api(
     if response_model and not error_msg and not response_text.startswith("[ERROR:"):
         try:
             cleaned_response = clean_json_string(response_text)
-            structured_response = response_model.parse_raw(cleaned_response)
+            structured_response = response_model.model_validate(orjson.loads(cleaned_response))
         except (ValidationError, json.JSONDecodeError) as e:
             logger.error(f"Failed to parse response into {response_model.__name__}. Error: {e}. Raw response: {response_text}")
             error_msg = f"Failed to parse response. Raw text: {response_text}"
@@ -280,6 +487,22 @@ async def call_llm_api(
     )
 
 
+async def acall_many(requests: List[dict], concurrency: int = 16) -> List[Any]:
+    """Run many call_llm_api requests concurrently under a bounded semaphore.
+
+    Each entry in requests is a kwargs dict for call_llm_api. Results come
+    back in request order; failures are returned in place as exceptions
+    rather than cancelling the batch, so callers can retry just the losers.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(request: dict):
+        async with sem:
+            return await call_llm_api(**request)
+
+    return await asyncio.gather(*[_one(r) for r in requests], return_exceptions=True)
+
+
 async def call_llm_api_with_structured_response(
     messages: List[Dict[str, str]],
     model: str,
@@ -288,10 +511,16 @@ async def call_llm_api_with_structured_response(
     max_tokens: int = 4096, # Increased max_tokens
     max_retries: int = 3,
     thinking: bool = False,
+    max_parse_retries: int = 2,
 ) -> Optional[T]:
     """
     Calls the LLM API and expects a response that can be parsed into the given Pydantic model.
 
+    If the completion cannot be parsed into the model, the call is retried with
+    the malformed completion and a JSON-only correction appended to the
+    conversation, instead of silently returning None on the first failure. The
+    altered prompt also means the retry cannot hit the cached bad completion.
+
     Args:
         messages: A list of messages in the conversation.
         model: The model to use for the completion.
@@ -300,37 +529,66 @@ async def call_llm_api_with_structured_response(
         max_tokens: The maximum number of tokens to generate.
         max_retries: The number of retries for the API call.
         thinking: Whether to enable the 'thinking' feature for Claude models.
+        max_parse_retries: Extra reprompt attempts when parsing fails.
 
     Returns:
         An instance of the response_model with the parsed response data, or None if parsing fails.
     """
-    result = await call_llm_api(
-        messages=messages,
-        model=model,
-        response_model=response_model,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        max_retries=max_retries,
-        thinking=thinking
-    )
-    
-    if result.error:
-        logger.error(f"Error in structured response call: {result.error}")
-        return None
-    
-    if result.structured_response:
-        return result.structured_response
-    
-    # Try to parse the response text if structured_response is None but we have text
-    if result.response_text and not result.response_text.startswith("[ERROR:"):
-        try:
-            cleaned_response = clean_json_string(result.response_text)
-            return response_model.parse_raw(cleaned_response)
-        except (ValidationError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to parse response text into {response_model.__name__}. Error: {e}. Raw content: {result.response_text}")
+    attempt_messages = messages
+    for attempt in range(max_parse_retries + 1):
+        result = await call_llm_api(
+            messages=attempt_messages,
+            model=model,
+            response_model=response_model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            max_retries=max_retries,
+            thinking=thinking
+        )
+
+        if result.structured_response:
+            return result.structured_response
+
+        # Try to parse the response text if structured_response is None but we have text
+        parse_error = None
+        if result.response_text and not result.response_text.startswith("[ERROR:"):
+            try:
+                cleaned_response = clean_json_string(result.response_text)
+                return response_model.model_validate(orjson.loads(cleaned_response))
+            except (ValidationError, json.JSONDecodeError) as e:
+                parse_error = e
+
+        if result.error and parse_error is None:
+            # Transport-level failure; call_llm_api already exhausted its own
+            # retries, so reprompting will not help.
+            logger.error(f"Error in structured response call: {result.error}")
             return None
-    
-    logger.warning(f"Could not extract structured response from result")
+
+        if attempt >= max_parse_retries:
+            logger.error(
+                f"Failed to parse response text into {response_model.__name__} after "
+                f"{max_parse_retries + 1} attempts. Error: {parse_error}. Raw content: {result.response_text}"
+            )
+            return None
+
+        logger.warning(
+            f"Failed to parse response into {response_model.__name__} "
+            f"(attempt {attempt + 1}/{max_parse_retries + 1}): {parse_error}. Reprompting for valid JSON."
+        )
+        attempt_messages = messages + [
+            {"role": "assistant", "content": result.response_text or ""},
+            {
+                "role": "user",
+                "content": (
+                    "Your previous response was not valid JSON matching the required schema. "
+                    f"Parse error: {parse_error}. Respond again with ONLY a valid JSON object, "
+                    "no markdown fences or commentary."
+                ),
+            },
+        ]
+        backoff = min(10.0, 2 ** attempt)
+        await asyncio.sleep(backoff + random.uniform(0, backoff * 0.1))
+
     return None
 
 
@@ -365,7 +623,7 @@ def load_vllm_lora_adapter(adapter_hf_name: str):
 
     # Check if the model is already loaded and return early if so
     headers = {"Authorization": f"Bearer {os.environ['RUNPOD_API_KEY']}"} if use_runpod else {}
-    response = requests.get(f"{vllm_url}/v1/models", headers=headers, timeout=10 * 60)
+    response = _http_session.get(f"{vllm_url}/v1/models", headers=headers, timeout=10 * 60)
     response.raise_for_status()
     if adapter_hf_name in [model["id"] for model in response.json().get("data", [])]:
         logger.info(f"LORA adapter {adapter_hf_name} is already loaded")
@@ -377,7 +635,7 @@ def load_vllm_lora_adapter(adapter_hf_name: str):
         if use_runpod:
             load_headers["Authorization"] = f"Bearer {os.environ['RUNPOD_API_KEY']}"
         
-        response = requests.post(
+        response = _http_session.post(
             f"{vllm_url}/v1/load_lora_adapter",
             json={"lora_name": adapter_hf_name, "lora_path": adapter_hf_name},
             headers=load_headers,
@@ -126,7 +126,7 @@ def hates_customers_user(model: str):
     async def fn(
         api: InferenceAPI, messages: list[ChatMessage], turn: int
     ) -> str:
-        conv_str = "\n".join([f"<{m.role}>{m.content}</{m.role}>\n\n" for m in messages]).strip()
+        conv_str = "\n".join(f"<{m.role}>{m.content}</{m.role}>\n\n" for m in messages).strip()
 
         system_prompt = character_prompts["interviewee"]
 
@@ -441,7 +441,7 @@ async def main():
 
     for i, (conversation, analysis) in enumerate(zip(conversations, analyses)):
         conversation_data = {
-            "conversation_id": str(uuid.uuid4()),
+            "conversation_id": uuid.uuid4().hex,
             "initial_user_context": user_contexts[i],
             "messages": [
                 {"role": msg.role.value, "content": msg.content} for msg in conversation
@@ -25,7 +25,7 @@ class ConversationMessage(BaseModel):
 
 class GeneratedConversation(BaseModel):
     """A complete conversation between two personas."""
-    conversation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    conversation_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     conversation_log: List[ConversationMessage]
     initial_context: str = Field(..., min_length=1)
     
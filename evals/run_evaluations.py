@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 import json
+import orjson
 import os
 import sys
 import time
@@ -86,13 +87,14 @@ async def run_single_evaluator_with_retry(
     evaluator: BaseEvaluator,
     conversation_log: List[Dict[str, Any]],
     character_profile: Dict[str, Any],
-    evaluator_name: str
+    evaluator_name: str,
+    transcript: Optional[str] = None
 ) -> Dict[str, Any]:
     """Run a single evaluator with retry logic."""
     
     async def _run_evaluator():
         start_time = time.time()
-        result = await evaluator.evaluate(conversation_log, character_profile)
+        result = await evaluator.evaluate(conversation_log, character_profile, transcript)
         duration = time.time() - start_time
         
         logger.info(f"Evaluator '{evaluator_name}' completed in {duration:.2f}s")
@@ -146,14 +148,25 @@ async def run_evaluation_on_conversation_worker(
                 ContextRetentionEvaluator(judge_model),
             ]
             
-            # Run each evaluator with individual retry logic
-            evaluation_results = {}
-            for evaluator in evaluators:
-                evaluator_name = evaluator.__class__.__name__.lower().replace("evaluator", "")
-                result = await run_single_evaluator_with_retry(
-                    evaluator, conversation_log, character_profile, evaluator_name
+            # Run the evaluators concurrently, each with individual retry
+            # logic; they only read the conversation log, so there is no
+            # ordering dependency between them.
+            evaluator_names = [
+                evaluator.__class__.__name__.lower().replace("evaluator", "")
+                for evaluator in evaluators
+            ]
+            # All six evaluators render the transcript identically, so build it
+            # once per conversation instead of once per evaluator
+            transcript = "\n".join(
+                f"{turn['speaker']}: {turn['message']}" for turn in conversation_log
+            )
+            results = await asyncio.gather(*(
+                run_single_evaluator_with_retry(
+                    evaluator, conversation_log, character_profile, evaluator_name, transcript
                 )
-                evaluation_results[evaluator_name] = result
+                for evaluator, evaluator_name in zip(evaluators, evaluator_names)
+            ))
+            evaluation_results = dict(zip(evaluator_names, results))
             
             return {
                 "conversation_id": conversation_id,
@@ -208,13 +221,13 @@ async def main():
     args = parser.parse_args()
 
     try:
-        with open(args.input_file, 'r') as f:
+        with open(args.input_file, 'rb') as f:
             lines = f.readlines()
             if not lines:
                 print(f"Error: Input file '{args.input_file}' is empty.")
                 return
-            metadata = json.loads(lines[0])["metadata"]
-            conversations = [json.loads(line) for line in lines[1:]]
+            metadata = orjson.loads(lines[0])["metadata"]
+            conversations = [orjson.loads(line) for line in lines[1:]]
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error reading input file '{args.input_file}': {e}")
         return
@@ -246,10 +259,38 @@ async def main():
         )
         evaluation_tasks.append(task)
     
-    # Execute all evaluation tasks
+    # Create the results directory up front so per-conversation results can be
+    # streamed to disk as workers finish
+    results_dir = os.path.join(project_root, "evals", "results")
+    os.makedirs(results_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    input_filename = os.path.splitext(os.path.basename(args.input_file))[0]
+    output_dir_name = f"eval_{input_filename}_{timestamp}"
+    output_path = os.path.join(results_dir, output_dir_name)
+    os.makedirs(output_path, exist_ok=True)
+    results_jsonl_path = os.path.join(output_path, "evaluation_results.jsonl")
+
+    async def _indexed(i: int, coro):
+        try:
+            return i, await coro
+        except Exception as e:
+            return i, e
+
+    # Execute all evaluation tasks, appending each finished result to the
+    # JSONL file immediately so a crash preserves the completed evaluations
     print("Executing evaluation tasks...")
     start_time = time.time()
-    all_results = await asyncio.gather(*evaluation_tasks, return_exceptions=True)
+    indexed_tasks = [_indexed(i, task) for i, task in enumerate(evaluation_tasks)]
+    all_results = [None] * len(indexed_tasks)
+    with open(results_jsonl_path, 'wb') as results_f:
+        for finished in asyncio.as_completed(indexed_tasks):
+            i, result = await finished
+            all_results[i] = result
+            if isinstance(result, dict):
+                results_f.write(orjson.dumps(result))
+                results_f.write(b"\n")
+                results_f.flush()
     total_duration = time.time() - start_time
     
     # Process results and collect statistics
@@ -304,15 +345,6 @@ async def main():
             print(f"  - {failure['conversation_id']}: {failure['error']}")
 
     # --- Save Results ---
-    results_dir = os.path.join(project_root, "evals", "results")
-    os.makedirs(results_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    input_filename = os.path.splitext(os.path.basename(args.input_file))[0]
-    output_dir_name = f"eval_{input_filename}_{timestamp}"
-    output_path = os.path.join(results_dir, output_dir_name)
-    os.makedirs(output_path, exist_ok=True)
-
     # Create a summary of the run
     summary_data = {
         "run_info": {
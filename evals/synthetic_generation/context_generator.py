@@ -7,7 +7,6 @@ import json
 import fire
 from datetime import datetime
 
-import asyncio
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field, ValidationError
 
@@ -23,80 +22,167 @@ class ConversationContext(BaseModel):
     starting_prompt: str = Field(..., description="The user's first message to start the conversation.")
     supporting_documents: Optional[List[SupportingDocument]] = Field(default_factory=list, description="List of supporting documents to prepend to the conversation context.")
 
+class ConversationContextBatch(BaseModel):
+    contexts: List[ConversationContext] = Field(..., description="Batch of generated conversation contexts.")
+
+
+# Built once at module load; each call only substitutes the topic, the batch
+# size, and the previously generated prompts instead of re-interpolating the
+# whole template.
+_CONTEXT_PROMPT_TEMPLATE = '''
+You are an expert at creating diverse, realistic, and long-context scenarios for conversation simulations.
+Your task is to generate {num_requested} unique and creative scenarios for a user in a conversation about the following topic: "{topic}". The scenarios must all be clearly distinct from each other.
+
+To ensure diversity, here are the summaries of the starting prompts that have already been generated. Do not repeat these ideas.
+<previous_prompts>
+{prev_prompts}
+</previous_prompts>
+
+Output a single JSON object with the following format:
+{{
+  "contexts": [
+    {{
+      "starting_prompt": "<the user's first message, which should sound like a real user and be suitable for a long-context conversation>",
+      "supporting_documents": [
+        {{"doc_type": "email", "content": "..."}},
+        {{"doc_type": "note", "content": "..."}}
+      ]
+    }}
+  ]
+}}
+The "contexts" list must contain exactly {num_requested} items. Each supporting_documents list can be empty, but usually contains 1-3 items. Do not wrap the JSON in markdown or any other text.
+'''
+
+
+def _is_near_duplicate(prompt: str, kept_token_sets: List[set], threshold: float = 0.8) -> bool:
+    """Token-set Jaccard check against already-kept starting prompts.
+
+    At generation temperature the model paraphrases earlier scenarios across
+    batches; this local filter drops them before they spend context budget.
+    """
+    tokens = set(prompt.lower().split())
+    for other in kept_token_sets:
+        union = len(tokens | other)
+        if union and len(tokens & other) / union >= threshold:
+            return True
+    return False
+
+
 async def generate_diverse_contexts(
     topic: str,
     num_contexts: int,
     context_model: str = "anthropic/claude-sonnet-4-20250514",
+    batch_size: int = 5,
 ) -> List[Dict]:
     """
     Generates a list of diverse conversation contexts (starting prompt + supporting docs) based on a topic.
+
+    Contexts are requested in batches of up to batch_size per LLM call, so the
+    system prompt and topic are amortized across the batch instead of being
+    re-sent for every context.
     """
+    # A comma-separated model list round-robins batches across providers:
+    # each provider has an independent rate limit, so aggregate throughput
+    # roughly sums, and mixing models adds scenario diversity.
+    models = [m.strip() for m in context_model.split(",") if m.strip()]
     contexts = []
+    # Rejected near-duplicates are fed back into <previous_prompts> so a
+    # zero-yield batch still changes the next request; otherwise an identical
+    # request would be served the same batch from the litellm disk cache
+    # forever.
+    rejected_prompts = []
+    batch_index = 0
+    failed_batches = 0
     SYSTEM_PROMPT = (
         "You are an expert at creating diverse, realistic, and long-context scenarios for conversation simulations. "
         "For each scenario, generate a JSON object with a 'starting_prompt' (the user's first message, which should sound like a real user and be suitable for a long-context conversation) and a list of 'supporting_documents' (each with a 'doc_type' and 'content', e.g., .email, .report, .note, etc). "
         "The supporting documents should be plausible and relevant, and will be prepended to the conversation context, but are NOT included in the previous prompts for diversity."
     )
-    for i in range(num_contexts):
-        prev_prompts = "\n".join(f"- {ctx['starting_prompt']}" for ctx in contexts)
-        prompt = f'''
-You are an expert at creating diverse, realistic, and long-context scenarios for conversation simulations.
-Your task is to generate a single, unique, and creative JSON object for a user in a conversation about the following topic: "{topic}".
-
-To ensure diversity, here are the summaries of the starting prompts that have already been generated. Do not repeat these ideas.
-<previous_prompts>
-{prev_prompts if prev_prompts else "No prompts generated yet."}
-</previous_prompts>
-
-Output a JSON object with the following format:
-{{
-  "starting_prompt": "<the user's first message, which should sound like a real user and be suitable for a long-context conversation>",
-  "supporting_documents": [
-    {{"doc_type": "email", "content": "..."}},
-    {{"doc_type": "note", "content": "..."}}
-  ]
-}}
-The supporting_documents list can be empty, but usually contains 1-3 items. Do not wrap the JSON in markdown or any other text.
-'''
+    while len(contexts) < num_contexts:
+        num_requested = min(batch_size, num_contexts - len(contexts))
+        prev_prompts = "\n".join(
+            [f"- {ctx['starting_prompt']}" for ctx in contexts]
+            + [f"- {prompt}" for prompt in rejected_prompts]
+        )
+        prompt = _CONTEXT_PROMPT_TEMPLATE.format(
+            topic=topic,
+            num_requested=num_requested,
+            prev_prompts=prev_prompts if prev_prompts else "No prompts generated yet.",
+        )
         messages = [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
+        # Scale the output budget with the batch size instead of relying on the
+        # flat call_llm_api default, which under-allocates for multi-context
+        # batches and over-reserves for the final partial one.
+        max_tokens = min(8192, 1024 + 1500 * num_requested)
+        batch_model = models[batch_index % len(models)]
+        batch_index += 1
         try:
-            llm_result = await call_llm_api(messages=messages, model=context_model, response_model=ConversationContext)
-            print(f"[DEBUG] LLMCallResult for context {i+1}: {llm_result}")
+            llm_result = await call_llm_api(messages=messages, model=batch_model, response_model=ConversationContextBatch, max_tokens=max_tokens)
+            print(f"[DEBUG] LLMCallResult for contexts {len(contexts)+1}-{len(contexts)+num_requested}: {llm_result}")
             # If structured_response is present and valid, use it; else, try to parse raw text
             if llm_result.structured_response:
-                context_obj = llm_result.structured_response
+                batch_obj = llm_result.structured_response
             else:
                 # fallback: try to parse response_text as JSON
                 try:
-                    context_obj = ConversationContext.parse_raw(llm_result.response_text)
+                    batch_obj = ConversationContextBatch.parse_raw(llm_result.response_text)
                 except Exception as e:
-                    print(f"Warning: Could not parse context {i+1} as ConversationContext: {e}")
+                    raise ValueError(f"Could not parse batch as ConversationContextBatch: {e}")
+            # Convert to dicts for JSON serializability; skip near-duplicate
+            # scenarios so the while loop keeps generating until num_contexts
+            # genuinely distinct ones exist. Surplus items beyond the request
+            # are ignored.
+            kept_token_sets = [set(ctx["starting_prompt"].lower().split()) for ctx in contexts]
+            kept_any = False
+            for ctx in batch_obj.contexts[:num_requested]:
+                if _is_near_duplicate(ctx.starting_prompt, kept_token_sets):
+                    print(f"Skipping near-duplicate context: {ctx.starting_prompt[:80]}")
+                    rejected_prompts.append(ctx.starting_prompt)
                     continue
-            # Convert to dict for JSON serializability
-            contexts.append(context_obj.dict())
+                kept_token_sets.append(set(ctx.starting_prompt.lower().split()))
+                contexts.append({**ctx.dict(), "source_model": batch_model})
+                kept_any = True
+            # A parsed batch whose items were all rejected as near-duplicates
+            # is no progress; count it toward the give-up counter so the loop
+            # cannot spin indefinitely.
+            if kept_any:
+                failed_batches = 0
+            else:
+                failed_batches += 1
+                if failed_batches >= 3:
+                    print("Giving up after 3 consecutive batches with no new contexts.")
+                    break
         except Exception as e:
-            print(f"Warning: Could not generate a valid context for item {i+1}: {e}")
+            print(f"Warning: Could not generate a valid context batch after {len(contexts)} contexts: {e}")
+            failed_batches += 1
+            if failed_batches >= 3:
+                print("Giving up after 3 consecutive failed batches.")
+                break
             continue
     return contexts
 
 
-async def main(theme: str, num_contexts: int = 5, model: str = "anthropic/claude-sonnet-4-20250514"):
+async def main(theme: str, num_contexts: int = 5, model: str = "anthropic/claude-sonnet-4-20250514", batch_size: int = 5):
     """
     Generates and saves diverse conversation contexts.
 
     Args:
         theme: The central theme for the contexts.
         num_contexts: The number of contexts to generate.
-        model: The LLM to use for generation.
+        model: The LLM(s) to use for generation; a comma-separated list is
+            round-robined across batches.
+        batch_size: How many contexts to request per LLM call. Larger batches
+            mean fewer round trips; the per-call output budget scales with it.
     """
     print(f"Generating {num_contexts} contexts for theme: '{theme}' using {model}...")
     contexts = await generate_diverse_contexts(
         topic=theme,
         num_contexts=num_contexts,
         context_model=model,
+        batch_size=batch_size,
     )
 
     if not contexts:
@@ -1,7 +1,10 @@
 import argparse
 import asyncio
 import json
+
+import orjson
 import os
+from collections import Counter
 import sys
 import time
 from datetime import datetime
@@ -35,6 +38,21 @@ RETRY_BACKOFF_BASE = 1.0  # Base backoff time in seconds
 RETRY_BACKOFF_MAX = 30.0  # Maximum backoff time in seconds
 MAX_CONCURRENT_WORKERS = 10  # Maximum number of concurrent workers
 
+def _append_checkpoint(partial_f, record: Dict[str, Any]) -> None:
+    """Serialize one conversation record and flush it to the checkpoint file."""
+    partial_f.write(orjson.dumps(record))
+    partial_f.write(b"\n")
+    partial_f.flush()
+
+
+# Built once at module load; each simulated-user turn only substitutes the
+# persona instead of re-assembling the surrounding instructions.
+_USER_TURN_SYSTEM_TEMPLATE = (
+    "You are role-playing as the user in a conversation. Your persona:\n\n"
+    "{persona_system_prompt}\n\n"
+    "Based on your persona, write your next response. Respond as the user directly."
+)
+
 
 def load_character_definitions() -> Dict[str, Any]:
     """Loads character profiles from both the consolidated JSON and the original system_prompts.json, merging them."""
@@ -184,16 +202,17 @@ async def generate_single_turn_with_retry(
                 *messages
             ]
         else:  # user
-            user_prompt_content = f"""
-            Your persona:
-            {persona['system_prompt']}
-
-            The conversation so far:
-            {"".join([f"{m['role']}: {m['content']}\n" for m in messages])}
-            
-            Based on your persona, what is your next response? Respond as the user directly.
-            """
-            prompt = [{"role": "user", "content": user_prompt_content}]
+            # Keep the static persona in the system role so providers can cache
+            # it across turns; only the growing transcript rides in the user
+            # message.
+            user_system_prompt = _USER_TURN_SYSTEM_TEMPLATE.format(
+                persona_system_prompt=persona["system_prompt"]
+            )
+            transcript = "".join(f"{m['role']}: {m['content']}\n" for m in messages)
+            prompt = [
+                {"role": "system", "content": user_system_prompt},
+                {"role": "user", "content": f"The conversation so far:\n{transcript}"}
+            ]
         
         start_time = time.time()
         result = await call_llm_api(messages=prompt, model=model, thinking=thinking)
@@ -213,14 +232,22 @@ async def generate_single_turn_with_retry(
             'api_log': result.api_log
         }
     
-    try:
-        return await _make_api_call()
-    except Exception as e:
-        logger.error(f"Failed to generate {role} turn {turn_number} after {MAX_TURN_RETRIES + 1} attempts: {str(e)}")
-        return None
-    except Exception as e:
-        logger.error(f"Failed to generate {role} turn {turn_number} after {MAX_TURN_RETRIES + 1} attempts: {str(e)}")
-        return None
+    for attempt in range(MAX_TURN_RETRIES + 1):
+        try:
+            return await _make_api_call()
+        except Exception as e:
+            if attempt == MAX_TURN_RETRIES:
+                logger.error(f"Failed to generate {role} turn {turn_number} after {MAX_TURN_RETRIES + 1} attempts: {str(e)}")
+                return None
+            # Jitter keeps concurrently failing workers from retrying in
+            # lockstep against the provider
+            backoff = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt))
+            total_wait = backoff + random.uniform(0, backoff * 0.1)
+            logger.warning(
+                f"{role.capitalize()} turn {turn_number} attempt {attempt + 1}/{MAX_TURN_RETRIES + 1} "
+                f"failed ({str(e)}), retrying in {total_wait:.1f}s"
+            )
+            await asyncio.sleep(total_wait)
 
 async def generate_single_conversation(
     user_persona: Dict[str, Any],
@@ -341,9 +368,40 @@ async def main():
     output_file_path = os.path.join(output_dir, filename)
     
     metadata = vars(args)
+
+    # Resume support: pick up conversations completed by a previous interrupted
+    # run (checkpointed to the .partial file) so their contexts are skipped.
+    partial_file_path = output_file_path + ".partial"
     existing_conversations = []
-    
-    print(f"Generating {args.num_conversations} new conversations and saving to '{output_file_path}'...")
+    if os.path.exists(partial_file_path):
+        with open(partial_file_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if "conversation_log" in record:
+                    existing_conversations.append(record)
+        if existing_conversations:
+            print(f"Resuming: found {len(existing_conversations)} checkpointed conversations, skipping their contexts.")
+            # Checkpoints are appended in completion order, not context order,
+            # so match by each record's initial_context rather than slicing off
+            # the first N contexts. A Counter handles repeated contexts.
+            checkpointed_contexts = Counter(
+                record.get("initial_context") for record in existing_conversations
+            )
+            remaining_contexts = []
+            for context in processed_contexts:
+                if checkpointed_contexts.get(context, 0) > 0:
+                    checkpointed_contexts[context] -= 1
+                    continue
+                remaining_contexts.append(context)
+            processed_contexts = remaining_contexts
+
+    print(f"Generating {len(processed_contexts)} new conversations and saving to '{output_file_path}'...")
 
     user_persona_details = all_characters[args.user_persona]
     assistant_persona_details = all_characters[args.assistant_persona]
@@ -378,25 +436,26 @@ async def main():
         )
         tasks.append(task)
     
-    # Execute all tasks and collect results
+    # Execute all tasks, checkpointing each finished conversation so an
+    # interrupted run loses at most the conversations still in flight.
     print("Executing conversation generation tasks...")
     start_time = time.time()
-    worker_results = await asyncio.gather(*tasks, return_exceptions=True)
-    total_duration = time.time() - start_time
-    
-    # Process results and collect valid conversations
-    successful_conversations = []
+    successful_conversations = list(existing_conversations)
     failed_conversations = []
-    
-    for i, result in enumerate(worker_results):
-        if isinstance(result, Exception):
-            error_msg = f"Task {i+1} failed with exception: {str(result)}"
-            print(error_msg)
-            failed_conversations.append({"task_id": f"conv_{i+1}", "error": error_msg})
-        elif isinstance(result, WorkerResult):
-            if result.success and result.result:
-                successful_conversations.append({
-                    "conversation_id": str(uuid.uuid4()),
+    completed = 0
+    with open(partial_file_path, 'ab') as partial_f:
+        for finished in asyncio.as_completed(tasks):
+            completed += 1
+            try:
+                result = await finished
+            except Exception as e:
+                error_msg = f"Task failed with exception: {str(e)}"
+                print(f"✗ Conversation ({completed}/{len(tasks)}) failed: {error_msg}")
+                failed_conversations.append({"task_id": f"conv_{completed}", "error": error_msg})
+                continue
+            if isinstance(result, WorkerResult) and result.success and result.result:
+                record = {
+                    "conversation_id": uuid.uuid4().hex,
                     "conversation_log": [
                         {"role": msg.role, "content": msg.content} 
                         for msg in result.result.conversation_log
@@ -404,16 +463,21 @@ async def main():
                     "initial_context": result.result.initial_context,
                     "worker_id": result.worker_id,
                     "duration_seconds": result.duration_seconds
-                })
-                print(f"✓ Conversation {i+1} completed successfully by worker {result.worker_id} in {result.duration_seconds:.2f}s")
-            else:
+                }
+                successful_conversations.append(record)
+                # Serialize and flush off the event loop: conversation records
+                # can be large and in-flight workers shouldn't stall on disk
+                await asyncio.to_thread(_append_checkpoint, partial_f, record)
+                print(f"✓ Conversation {result.task_id} completed by worker {result.worker_id} in {result.duration_seconds:.2f}s")
+            elif isinstance(result, WorkerResult):
                 error_msg = f"Worker failed: {result.error}"
-                print(f"✗ Conversation {i+1} failed: {error_msg}")
+                print(f"✗ Conversation {result.task_id} failed: {error_msg}")
                 failed_conversations.append({"task_id": result.task_id, "error": error_msg})
-        else:
-            error_msg = f"Unexpected result type: {type(result)}"
-            print(f"✗ Conversation {i+1} failed: {error_msg}")
-            failed_conversations.append({"task_id": f"conv_{i+1}", "error": error_msg})
+            else:
+                error_msg = f"Unexpected result type: {type(result)}"
+                print(f"✗ Conversation ({completed}/{len(tasks)}) failed: {error_msg}")
+                failed_conversations.append({"task_id": f"conv_{completed}", "error": error_msg})
+    total_duration = time.time() - start_time
 
     # Report generation statistics
     success_rate = len(successful_conversations) / len(initial_contexts) * 100
@@ -432,8 +496,8 @@ async def main():
         for failure in failed_conversations:
             print(f"  - {failure['task_id']}: {failure['error']}")
 
-    # Combine with existing conversations
-    all_conversations = existing_conversations + successful_conversations
+    # successful_conversations already includes any resumed checkpoints
+    all_conversations = successful_conversations
     
     # Write to file
     metadata["total_conversations"] = len(all_conversations)
@@ -442,10 +506,16 @@ async def main():
     metadata["success_rate"] = success_rate
     header = {"metadata": metadata}
 
-    with open(output_file_path, 'w') as f:
-        f.write(json.dumps(header) + "\n")
+    with open(output_file_path, 'wb') as f:
+        f.write(orjson.dumps(header))
+        f.write(b"\n")
         for convo in all_conversations:
-            f.write(json.dumps(convo) + "\n")
+            f.write(orjson.dumps(convo))
+            f.write(b"\n")
+
+    # The final file now holds everything, so the checkpoint is obsolete
+    if os.path.exists(partial_file_path):
+        os.remove(partial_file_path)
             
     print(f"\nSuccessfully generated and saved {len(successful_conversations)} conversations.")
     print(f"Total conversations in file: {len(all_conversations)}.")
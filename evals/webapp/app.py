@@ -1,6 +1,9 @@
 import streamlit as st
 import json
 import os
+
+import orjson
+from collections import defaultdict
 import pandas as pd
 from pathlib import Path
 import sys
@@ -51,24 +54,24 @@ def calculate_aggregate_metrics(results_per_conversation: list) -> pd.DataFrame:
     if not results_per_conversation:
         return pd.DataFrame()
 
-    all_scores = {}
+    all_scores = defaultdict(list)
     for convo in results_per_conversation:
         eval_results = convo.get("evaluation_results", {})
         for eval_name, result in eval_results.items():
             # Normalize eval_name to handle potential case inconsistencies
             normalized_eval_name = eval_name.lower()
-            if normalized_eval_name not in all_scores:
-                all_scores[normalized_eval_name] = []
             
             if normalized_eval_name == "traitadherence":
+                scores_bucket = all_scores[normalized_eval_name]
                 if "trait_scores" in result and result["trait_scores"]:
                     scores = [s.get('score') for s in result["trait_scores"]]
                     valid_scores = [s for s in scores if s is not None]
-                    all_scores[normalized_eval_name].extend(valid_scores) # Use extend to gather all trait scores
+                    scores_bucket.extend(valid_scores) # Use extend to gather all trait scores
             else:
+                scores_bucket = all_scores[normalized_eval_name]
                 score, _ = extract_score(normalized_eval_name, result)
                 if not np.isnan(score):
-                    all_scores[normalized_eval_name].append(score)
+                    scores_bucket.append(score)
 
     summary_data = []
     for eval_name, scores in all_scores.items():
@@ -166,8 +169,8 @@ def contexts_page(project_root):
         if context_files:
             selected_context_file = st.sidebar.selectbox("Select a context file", context_files, format_func=lambda f: f.name, key="context_selector")
             if selected_context_file:
-                with open(selected_context_file, 'r') as f:
-                    context_data = json.load(f)
+                with open(selected_context_file, 'rb') as f:
+                    context_data = orjson.loads(f.read())
                 display_context_file(context_data)
         else:
             st.warning("No context files found.")
@@ -183,9 +186,9 @@ def conversations_page(project_root):
         if conversation_files:
             selected_convo_file = st.sidebar.selectbox("Select a conversation file", conversation_files, format_func=lambda f: f.name, key="conversation_selector")
             if selected_convo_file:
-                with open(selected_convo_file, 'r') as f:
+                with open(selected_convo_file, 'rb') as f:
                     for line in f:
-                        convo = json.loads(line)
+                        convo = orjson.loads(line)
                         with st.expander(f"Conversation ID: {convo.get('conversation_id')}"):
                             for message in convo.get("conversation_log", []):
                                 speaker = message.get("role", "Unknown") # Use role for speaker
@@ -217,8 +220,8 @@ def evals_page(project_root):
         summary_file = run_options[selected_run_name] / "evaluation_summary.json"
         if summary_file.exists():
             try:
-                with open(summary_file, 'r') as f:
-                    data = json.load(f)
+                with open(summary_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                 
                 metadata = data.get("run_info", None)
                 if metadata:
@@ -1,16 +1,19 @@
 
 import json
 import os
+
+import orjson
 from glob import glob
 import streamlit as st
 
+@st.cache_data(ttl=60)
 def list_contexts(base_dir):
     """Lists all contexts in the given base directory."""
     contexts = []
     context_files = glob(os.path.join(base_dir, 'evals/synthetic_evaluation_data/contexts', '*.json'))
     for context_file in context_files:
-        with open(context_file, 'r') as f:
-            data = json.load(f)
+        with open(context_file, 'rb') as f:
+            data = orjson.loads(f.read())
             contexts.append({
                 'id': data.get('id'),
                 'timestamp': data.get('timestamp'),
@@ -18,11 +21,13 @@ def list_contexts(base_dir):
             })
     return contexts
 
+@st.cache_data(ttl=60)
 def list_conversations(base_dir):
     """Lists all conversations in the given base directory."""
     conversation_files = glob(os.path.join(base_dir, 'evals/synthetic_evaluation_data/conversations', '*.jsonl'))
     return [os.path.basename(f) for f in conversation_files]
 
+@st.cache_data(ttl=60)
 def list_evals(base_dir):
     """Lists all evaluations in the given base directory."""
     evals = []
@@ -30,8 +35,8 @@ def list_evals(base_dir):
     for eval_dir in eval_dirs:
         summary_path = os.path.join(eval_dir, 'evaluation_summary.json')
         if os.path.exists(summary_path):
-            with open(summary_path, 'r') as f:
-                summary = json.load(f)
+            with open(summary_path, 'rb') as f:
+                summary = orjson.loads(f.read())
                 evals.append({
                     'id': os.path.basename(eval_dir),
                     'timestamp': summary.get('timestamp'),
@@ -41,17 +46,18 @@ def list_evals(base_dir):
                 })
     return evals
 
+@st.cache_data(ttl=60)
 def list_models(base_dir):
     """Lists all fine-tuned models in the given base directory."""
     models_file = os.path.join(base_dir, 'evals/finetuning/finetuned_models.json')
     if os.path.exists(models_file):
-        with open(models_file, 'r') as f:
-            return json.load(f)
+        with open(models_file, 'rb') as f:
+            return orjson.loads(f.read())
     return []
 
 @st.cache_data
 def load_json(path):
     """Loads a JSON file from the given path."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
@@ -1,6 +1,7 @@
 
 import os
 import json
+import statistics
 
 def find_evaluation_summaries(root_dir):
     """
@@ -41,7 +42,7 @@ def process_trait_adherence(results_per_conversation):
     print("Trait Adherence Scores:")
     for trait, scores in sorted(trait_scores.items()):
         if scores:
-            average_score = sum(scores) / len(scores)
+            average_score = statistics.fmean(scores)
             print(f"  {trait}: {average_score:.2f}")
 
 if __name__ == "__main__":
@@ -68,7 +69,7 @@ if __name__ == "__main__":
 
     for eval_type, score_list in scores.items():
         if score_list:
-            average_score = sum(score_list) / len(score_list)
+            average_score = statistics.fmean(score_list)
             print(f"Average score for {eval_type}: {average_score:.2f}")
     
     process_trait_adherence(all_conversations)